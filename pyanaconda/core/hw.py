@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+from functools import cache
+
 from blivet.arch import get_arch, is_arm
 from pyanaconda.core.util import execWithCapture
 
@@ -50,6 +52,7 @@ def minimal_memory_needed(with_gui=False, with_squashfs=False):
     return result
 
 
+@cache
 def detect_virtualized_platform():
     """Detect execution in a virtualized environment.
 
@@ -58,6 +61,9 @@ def detect_virtualized_platform():
 
     Otherwise, it returns None.
 
+    The detection cannot change while the installer is running,
+    so the result is cached.
+
     :return: a virtualization technology identifier or None
     """
     try:
@@ -32,10 +32,6 @@ import functools
 import importlib.util
 import importlib.machinery
 
-import requests
-from requests_file import FileAdapter
-from requests_ftp import FTPAdapter
-
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.path import make_directories, open_with_perm, join_paths
 from pyanaconda.core.constants import DRACUT_SHUTDOWN_EJECT, \
@@ -580,6 +576,13 @@ def runOnErrorScripts(scripts):
 
 def requests_session():
     """Return a requests.Session object with file and ftp support."""
+    # Import on first use. Almost every process imports this module,
+    # but only a few download anything, so don't make all of them pay
+    # the start-up cost of requests and its dependencies.
+    import requests
+    from requests_file import FileAdapter
+    from requests_ftp import FTPAdapter
+
     session = requests.Session()
     session.mount("file://", FileAdapter())
     session.mount("ftp://", FTPAdapter())
@@ -314,6 +314,10 @@ class TreeInfoMetadata(object):
 
             # Download the metadata file.
             for name in self.TREE_INFO_NAMES:
+                # Don't re-request files that are known to be missing.
+                if name in not_found:
+                    continue
+
                 file_url = "{}/{}".format(url, name)
 
                 try:
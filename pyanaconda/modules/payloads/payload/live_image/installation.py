@@ -53,6 +53,7 @@ class DownloadImageTask(Task):
         self._url = configuration.url
         self._proxy = configuration.proxy
         self._ssl_verify = configuration.ssl_verification_enabled
+        self._checksum = configuration.checksum
         self._download_path = download_path
 
     @property
@@ -75,13 +76,15 @@ class DownloadImageTask(Task):
             log.info("Nothing to download.")
             return self._url.removeprefix("file://")
 
+        resume_offset = self._get_resume_offset()
+
         with requests_session() as session:
             try:
                 # Send a GET request to the image URL.
-                response = self._send_request(session)
+                response = self._send_request(session, resume_offset)
 
                 # Download the image to a file.
-                self._download_image(response)
+                self._download_image(response, resume_offset)
 
             except requests.exceptions.RequestException as e:
                 raise PayloadInstallationError(
@@ -90,51 +93,99 @@ class DownloadImageTask(Task):
 
         return self._download_path
 
-    def _send_request(self, session):
-        """Send a GET request to the image URL."""
+    def _get_resume_offset(self):
+        """Get the size of a previous partial download, if any.
+
+        Resume only if the result will be verified against a configured
+        checksum. The server cannot tell us whether the partial file
+        still matches the image it serves, so without a checksum a
+        changed image could be spliced together silently.
+        """
+        if not self._checksum:
+            return 0
+
+        try:
+            return os.path.getsize(self._download_path)
+        except OSError:
+            return 0
+
+    def _send_request(self, session, resume_offset=0):
+        """Send a GET request to the image URL.
+
+        If a partial download already exists, request only the missing
+        part of the image with a Range header. Servers that don't
+        support ranges simply reply with the full image.
+        """
+        headers = {}
+
+        if resume_offset:
+            log.debug("Resuming the download at %d bytes.", resume_offset)
+            headers["Range"] = "bytes={}-".format(resume_offset)
+
         proxies = get_proxies_from_option(
             self._proxy
         )
         response = session.get(
             url=self._url,
+            headers=headers,
             proxies=proxies,
             verify=self._ssl_verify,
             stream=True,
             timeout=NETWORK_CONNECTION_TIMEOUT,
         )
+
+        # The partial file doesn't match the image on the server
+        # anymore. Request the full image instead.
+        if resume_offset and response.status_code == \
+                requests.codes.requested_range_not_satisfiable:
+            response.close()
+            return self._send_request(session)
+
         response.raise_for_status()
         return response
 
-    def _download_image(self, response):
+    def _download_image(self, response, resume_offset=0):
         """Download the image to a file."""
+        # Start from scratch unless the server honored the Range header.
+        if response.status_code != requests.codes.partial_content:
+            resume_offset = 0
+
         # Handle no content length header.
         if not self._get_content_length(response):
             download = self._direct_download
         else:
             download = self._stream_download
 
-        # Download the image to a file.
-        with open(self._download_path, "wb") as image_file:
-            download(response, image_file)
+        # Download the image to a file. Append to the partial
+        # file if we are resuming a previous download.
+        with open(self._download_path, "ab" if resume_offset else "wb") as image_file:
+            download(response, image_file, resume_offset)
 
     def _get_content_length(self, response):
         """Get the content length value."""
         return response.headers.get('content-length')
 
-    def _direct_download(self, response, image_file):
-        """Download the image at once."""
+    def _direct_download(self, response, image_file, resume_offset=0):
+        """Download the image without progress reporting.
+
+        Stream the response body to the file instead of accessing
+        response.content, which would buffer the whole image in memory.
+        """
         log.warning(
             "content-length header is missing for the installation "
             "image, download progress reporting will not be available"
         )
 
         self.report_progress(_("Downloading {}").format(self._url))
-        image_file.write(response.content)
+
+        for chunk in response.iter_content(1024 * 1024):
+            image_file.write(chunk)
+
         log.debug("Downloaded %s.", self._url)
 
-    def _stream_download(self, response, image_file):
+    def _stream_download(self, response, image_file, resume_offset=0):
         """Download the image in 1 MB chunks."""
-        total_size = int(self._get_content_length(response))
+        total_size = int(self._get_content_length(response)) + resume_offset
 
         progress = DownloadProgress(
             url=self._url,
@@ -143,14 +194,13 @@ class DownloadImageTask(Task):
         )
 
         progress.start()
-        downloaded_size = 0
+        downloaded_size = resume_offset
 
         for chunks in response.iter_content(1024 * 1024):
             if not chunks:
                 continue
 
             image_file.write(chunks)
-            image_file.flush()
 
             downloaded_size += len(chunks)
             progress.update(downloaded_size)
@@ -200,14 +250,8 @@ class VerifyImageChecksumTask(Task):
     @staticmethod
     def _calculate_checksum(file_path):
         """Calculate the file checksum."""
-        sha256 = hashlib.sha256()
-
         with open(file_path, "rb") as f:
-            while True:
-                data = f.read(1024 * 1024)
-                if not data:
-                    break
-                sha256.update(data)
+            sha256 = hashlib.file_digest(f, "sha256")
 
         checksum = sha256.hexdigest()
         log.debug("sha256 of %s: %s", file_path, checksum)
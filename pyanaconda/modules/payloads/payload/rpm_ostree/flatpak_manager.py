@@ -166,6 +166,7 @@ class FlatpakManager(object):
             if remote.get_name() == name:
                 installation.remove_remote(name, None)
                 log.debug("Flatpak remote %s removed", name)
+                break
 
     def install_all(self):
         """Install all the refs contained on the remote."""
@@ -257,12 +258,12 @@ class BaseRefsList(ABC):
         """
         self._installation = installation
 
-        self._refs = []
+        self._refs = None
 
     @property
     def refs(self):
         """Get list of installed application refs."""
-        if not self._refs:
+        if self._refs is None:
             self._load_refs()
 
         return self._refs
@@ -313,11 +314,7 @@ class RemoteRefsList(BaseRefsList):
         :return: sum of bytes of the installation size of the all flatpaks
         :rtype: int
         """
-        size_sum = 0
-        for ref in self.refs:
-            size_sum = size_sum + ref.get_installed_size()
-
-        return size_sum
+        return sum(ref.get_installed_size() for ref in self.refs)
 
 
 class InstalledRefsList(BaseRefsList):
@@ -350,5 +347,9 @@ class InstalledRefsList(BaseRefsList):
             new_variant = Variant.new_tuple(*children)
             serialized = new_variant.get_data_as_bytes().get_data()
 
-            with open(deploy_path, "wb") as f:
+            # Replace the deploy file atomically, so an interrupted
+            # installation can't leave a truncated file behind.
+            with open(deploy_path + ".new", "wb") as f:
                 f.write(serialized)
+
+            os.replace(deploy_path + ".new", deploy_path)
@@ -15,8 +15,6 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
-from blivet.size import Size
-
 from pyanaconda.modules.common.task import Task
 from pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager import FlatpakManager
 
@@ -51,8 +49,7 @@ class GetFlatpaksSizeTask(Task):
             flatpak_payload.initialize_with_path("/var/tmp/anaconda-flatpak-temp")
 
             # Return the size in bytes.
-            required_size = Size(flatpak_payload.get_required_size())
-            return required_size.get_bytes()
+            return flatpak_payload.get_required_size()
 
         finally:
             # Clean up temporal repo again
@@ -82,24 +82,19 @@ def download_escrow_certificate(url):
     # Download the certificate.
     log.info("Downloading an escrow certificate from: %s", url)
 
-    try:
-        request = util.requests_session().get(url, verify=True)
-    except requests.exceptions.SSLError as e:
-        raise StorageError(
-            _("SSL error while downloading the escrow certificate:\n\n{}").format(str(e))
-        ) from e
-    except requests.exceptions.RequestException as e:
-        raise StorageError(
-            _("The following error was encountered while downloading "
-              "the escrow certificate:\n\n{}").format(str(e))
-        ) from e
-
-    try:
-        certificate = request.content
-    finally:
-        request.close()
-
-    return certificate
+    with util.requests_session() as session:
+        try:
+            with session.get(url, verify=True) as request:
+                return request.content
+        except requests.exceptions.SSLError as e:
+            raise StorageError(
+                _("SSL error while downloading the escrow certificate:\n\n{}").format(str(e))
+            ) from e
+        except requests.exceptions.RequestException as e:
+            raise StorageError(
+                _("The following error was encountered while downloading "
+                  "the escrow certificate:\n\n{}").format(str(e))
+            ) from e
 
 
 def find_backing_device(devicetree, mount_point):
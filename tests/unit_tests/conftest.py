@@ -0,0 +1,30 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_virtualization_detection_cache():
+    """Don't leak the cached virtualization detection between tests.
+
+    The detection result is cached for the lifetime of the process,
+    but the whole test suite runs in one process and tests mock the
+    detection with different results.
+    """
+    from pyanaconda.core.hw import detect_virtualized_platform
+    detect_virtualized_platform.cache_clear()
@@ -29,15 +29,22 @@ class MiscHwUtilsTests(unittest.TestCase):
     @patch("pyanaconda.core.hw.execWithCapture")
     def test_detect_virtualized_platform(self, exec_mock):
         """Test the function detect_virtualized_platform."""
+        detect_virtualized_platform.cache_clear()
         exec_mock.side_effect = OSError
         assert detect_virtualized_platform() is None
 
+        detect_virtualized_platform.cache_clear()
         exec_mock.side_effect = ["none"]
         assert detect_virtualized_platform() is None
 
+        detect_virtualized_platform.cache_clear()
         exec_mock.side_effect = ["vmware"]
         assert detect_virtualized_platform() == "vmware"
 
+        # The result is cached, so the detection doesn't run again.
+        assert detect_virtualized_platform() == "vmware"
+        assert exec_mock.call_count == 3
+
     @patch("pyanaconda.core.hw.open")
     @patch("pyanaconda.core.hw.is_arm")
     def test_is_lpae_available(self, is_arm, mock_open):
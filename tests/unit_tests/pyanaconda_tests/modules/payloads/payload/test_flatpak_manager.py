@@ -324,6 +324,7 @@ class FlatpakTest(unittest.TestCase):
 
         self._installation.remove_remote.assert_called_once_with("hive", None)
 
+    @patch("pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager.os.replace")
     @patch("pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager.Variant")
     @patch("pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager.VariantType")
     @patch("pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager.open")
@@ -331,7 +332,7 @@ class FlatpakTest(unittest.TestCase):
     @patch("pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager.Installation")
     @patch("pyanaconda.modules.payloads.payload.rpm_ostree.flatpak_manager.Remote")
     def test_replace_remote(self, remote_cls, installation_cls, transaction_cls,
-                            open_mock, variant_type, variant):
+                            open_mock, variant_type, variant, replace_mock):
         """Test flatpak replace remote for installed refs call."""
         flatpak = FlatpakManager("/system/test-root")
         self._setup_flatpak_objects(remote_cls, installation_cls, transaction_cls)
@@ -351,11 +352,19 @@ class FlatpakTest(unittest.TestCase):
         # test that every file is read and written
         open_mock.assert_has_calls([
             call("/path/app/org.test/x86_64/stable/active/deploy", "rb"),
-            call("/path/app/org.test/x86_64/stable/active/deploy", "wb"),
+            call("/path/app/org.test/x86_64/stable/active/deploy.new", "wb"),
             call("/path/runtime/org.run/x86_64/stable/active/deploy", "rb"),
-            call("/path/runtime/org.run/x86_64/stable/active/deploy", "wb"),
+            call("/path/runtime/org.run/x86_64/stable/active/deploy.new", "wb"),
         ], any_order=True)
 
+        # test that every file is replaced atomically
+        replace_mock.assert_has_calls([
+            call("/path/app/org.test/x86_64/stable/active/deploy.new",
+                 "/path/app/org.test/x86_64/stable/active/deploy"),
+            call("/path/runtime/org.run/x86_64/stable/active/deploy.new",
+                 "/path/runtime/org.run/x86_64/stable/active/deploy"),
+        ])
+
 
 class OperationMock(object):
     """Mock of the Flatpak.TransactionOperation class."""
@@ -21,6 +21,7 @@ from unittest.mock import Mock, patch
 
 from pyanaconda.core.constants import REQUIREMENT_TYPE_PACKAGE, REQUIREMENT_TYPE_GROUP, \
     MULTILIB_POLICY_ALL, MULTILIB_POLICY_BEST
+from pyanaconda.core.hw import detect_virtualized_platform
 from pyanaconda.modules.common.constants.services import LOCALIZATION, BOSS
 from pyanaconda.modules.common.structures.requirement import Requirement
 from pyanaconda.modules.payloads.payload.dnf.dnf_manager import DNFManager
@@ -104,11 +105,13 @@ class DNFRequirementsTestCase(unittest.TestCase):
         assert requirements == []
 
         # Unsupported platform is detected.
+        detect_virtualized_platform.cache_clear()
         execute.return_value = "qemu"
         requirements = collect_platform_requirements(dnf_manager)
         assert requirements == []
 
         # Supported platform is detected.
+        detect_virtualized_platform.cache_clear()
         execute.return_value = "vmware"
         requirements = collect_platform_requirements(dnf_manager)
 
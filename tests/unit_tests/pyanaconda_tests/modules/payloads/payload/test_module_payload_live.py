@@ -404,7 +404,7 @@ class DownloadImageTaskTestCase(unittest.TestCase):
         session = session_getter.return_value.__enter__.return_value
         response = session.get.return_value
         response.headers = {}
-        response.content = b"CONTENT"
+        response.iter_content.return_value = [b"CONTENT"]
 
         # Run the task.
         with self._create_directory():
@@ -419,6 +419,7 @@ class DownloadImageTaskTestCase(unittest.TestCase):
         # Check the calls.
         session.get.assert_called_once_with(
             url='http://source',
+            headers={},
             proxies={
                 'http': 'http://proxy:3128',
                 'https': 'http://proxy:3128'
@@ -432,6 +433,125 @@ class DownloadImageTaskTestCase(unittest.TestCase):
             0, 'Downloading http://source'
         )
 
+    @patch_requests()
+    def test_remote_file_resume(self, session_getter):
+        """Mock a resumed download of a remote file."""
+        # Set up the response for a partial content request.
+        session = session_getter.return_value.__enter__.return_value
+        response = session.get.return_value
+        response.status_code = 206
+        response.headers = {"content-length": "4"}
+        response.iter_content.return_value = [b"TENT"]
+
+        # Run the task with a partial file and a configured checksum.
+        with self._create_directory():
+            self.data.url = "http://source"
+            self.data.checksum = "FAKE"
+
+            with open(self.download_path, "wb") as f:
+                f.write(b"CON")
+
+            self._run_task()
+
+            with open(self.download_path, "rb") as f:
+                assert f.read() == b"CONTENT"
+
+        # Check that only the missing part was requested.
+        assert session.get.call_args.kwargs["headers"] == {"Range": "bytes=3-"}
+
+        # Check that the progress covers the complete image.
+        assert self.callback.mock_calls == [
+            call(0, 'Downloading http://source (0%)'),
+            call(0, 'Downloading http://source (100%)'),
+        ]
+
+    @patch_requests()
+    def test_remote_file_resume_unsupported(self, session_getter):
+        """Mock a resumed download without server-side range support."""
+        # Set up the response with the full content.
+        session = session_getter.return_value.__enter__.return_value
+        response = session.get.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content.return_value = [b"CONTENT"]
+
+        # Run the task with a partial file and a configured checksum.
+        with self._create_directory():
+            self.data.url = "http://source"
+            self.data.checksum = "FAKE"
+
+            with open(self.download_path, "wb") as f:
+                f.write(b"GARBAGE")
+
+            self._run_task()
+
+            # Check that the partial file was thrown away.
+            with open(self.download_path, "rb") as f:
+                assert f.read() == b"CONTENT"
+
+        # Check that a resume was requested.
+        assert session.get.call_args.kwargs["headers"] == {"Range": "bytes=7-"}
+
+    @patch_requests()
+    def test_remote_file_resume_invalid_range(self, session_getter):
+        """Mock a resumed download with an unsatisfiable range."""
+        session = session_getter.return_value.__enter__.return_value
+
+        # Reject the range request.
+        rejected = MagicMock()
+        rejected.status_code = 416
+
+        # Accept the full request.
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content.return_value = [b"CONTENT"]
+
+        session.get.side_effect = [rejected, response]
+
+        # Run the task with a partial file and a configured checksum.
+        with self._create_directory():
+            self.data.url = "http://source"
+            self.data.checksum = "FAKE"
+
+            with open(self.download_path, "wb") as f:
+                f.write(b"STALE IMAGE!")
+
+            self._run_task()
+
+            with open(self.download_path, "rb") as f:
+                assert f.read() == b"CONTENT"
+
+        # Check that the download was retried without the Range header.
+        rejected.close.assert_called_once_with()
+        assert session.get.call_count == 2
+        assert session.get.call_args.kwargs["headers"] == {}
+
+    @patch_requests()
+    def test_remote_file_no_resume_without_checksum(self, session_getter):
+        """Don't resume a download that cannot be verified."""
+        # Set up the response.
+        session = session_getter.return_value.__enter__.return_value
+        response = session.get.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content.return_value = [b"CONTENT"]
+
+        # Run the task with a partial file, but without a checksum.
+        with self._create_directory():
+            self.data.url = "http://source"
+
+            with open(self.download_path, "wb") as f:
+                f.write(b"GARBAGE")
+
+            self._run_task()
+
+            with open(self.download_path, "rb") as f:
+                assert f.read() == b"CONTENT"
+
+        # Check that no resume was requested.
+        assert session.get.call_args.kwargs["headers"] == {}
+
     @patch_requests()
     def test_remote_file_failed(self, session_getter):
         """Mock a failed download of a remote file."""